@@ -18,15 +18,16 @@ class GUiManagement():
     def __init__(self):
         self.init_variables()
 
-    def init_ui_variables(self, toolbox_wrapper, footer_toolbox, in_im_canvas, out_im_canvas, 
+    def init_ui_variables(self, toolbox_wrapper, footer_toolbox, in_im_canvas, out_im_canvas,
                           left_title, right_title, vis_mod_list, color_chan_list, zoom_btns):
         """
         Gets the necessary widgets and layout from the 'main_window' and sets up the pipeline.
+        The shared histogram canvas is created lazily by the main window on first use.
         Args:
             toolbox_wrapper (QVBoxLayout): The layout where the toolboxes are added.
             footer_toolbox (QWidget): The footer widget for the toolbox layout.
-            in_im_canvas (MatplotlibCanvas): The canvas for displaying the input image.
-            out_im_canvas (MatplotlibCanvas): The canvas for displaying the output image.
+            in_im_canvas (ImageCanvas): The canvas for displaying the input image.
+            out_im_canvas (ImageCanvas): The canvas for displaying the output image.
             left_title (QLabel): The label for the left title.
             right_title (QLabel): The label for the right title.
         """
@@ -40,8 +41,11 @@ class GUiManagement():
         self.color_chan_list = color_chan_list
         self.zoom_btn_1, self.zoom_btn_2, self.zoom_btn_3 = zoom_btns
 
+        # Per-canvas scratch buffers reused for grayscale-to-BGRA display conversion
+        self._bgra_scratch = [None, None]
+
         # Initialize the pipeline
-        self.pipeline = Pipeline()  
+        self.pipeline = Pipeline()
 
         # Modes and their corresponding methods which are called when the mode is activated.
         self.view_handlers = {      
@@ -52,9 +56,9 @@ class GUiManagement():
 
         # Declares which widgets will be shown and which widgets will be hidden based on the selected mode.
         self.widgets_per_mode = {
-            "Image": [self.left_title, self.right_title],
+            "Image": [self.left_title, self.right_title, self.in_im_canvas, self.out_im_canvas],
             "Histogram": [self.zoom_btn_1, self.zoom_btn_2, self.zoom_btn_3],
-            "Frequency": [self.left_title, self.right_title]
+            "Frequency": [self.left_title, self.right_title, self.in_im_canvas, self.out_im_canvas]
         }
 
 
@@ -205,6 +209,9 @@ class GUiManagement():
         for widget in widgets_to_show:
             widget.show()
 
+        # Give the top row to whichever canvases the mode uses
+        self.set_top_row_mode(mode_name == "Histogram")
+
         # Update the view mode and color channel variables
         self.view_mode = mode_name                  
         self.color_channel = VISUALIZATION_TYPES[mode_name][0].split(" ")[0]                   
@@ -225,9 +232,11 @@ class GUiManagement():
         if self.input_BGRA is None:
             return
         
-        # Reset the input and output image canvases       
-        self.in_im_canvas.reset_plot()
-        self.out_im_canvas.reset_plot()
+        # Reset the input and output canvases
+        self.in_im_canvas.reset_zoom()
+        self.out_im_canvas.reset_zoom()
+        if self.hist_canvas is not None:
+            self.hist_canvas.reset_plot()
 
         self.color_channel = channel_name.split(" ")[0]     # get the color channel name from the button text
         self.view_handlers[self.view_mode]()                # update the view based on the current view mode
@@ -235,10 +244,10 @@ class GUiManagement():
 
     def display_images(self, images):
         """
-        Display input and output images on the embedded matplotlib canvas.
+        Display input and output images on the image canvases.
 
         Parameters:
-            images (list): A list containing the images to be displayed. 
+            images (list): A list containing the images to be displayed.
         """
         # Toggle visibility of titles based on the color channel
         if self.color_channel == "RGBA":
@@ -250,54 +259,55 @@ class GUiManagement():
             self.left_title.setText(f"{self.color_channel} Channel")
             self.right_title.setText(f"{self.color_channel} Channel")
 
-        # Convert the images to BGRA format if they are 1-channel grayscale images
+        # Convert the images to BGRA format if they are 1-channel grayscale images,
+        # reusing a preallocated destination buffer so every pipeline update does
+        # not pay a fresh allocation for the converted frame
         for i in range(len(images)):
             if len(images[i].shape) == 2:
-                images[i] = cv2.cvtColor(images[i], cv2.COLOR_GRAY2BGRA)
+                shape = images[i].shape + (4,)
+                if self._bgra_scratch[i] is None or self._bgra_scratch[i].shape != shape:
+                    self._bgra_scratch[i] = np.empty(shape, dtype=np.uint8)
+                images[i] = cv2.cvtColor(images[i], cv2.COLOR_GRAY2BGRA, dst=self._bgra_scratch[i])
 
-        # Plot the images on the respective canvases
+        # Hand the BGRA arrays to the native Qt canvases
         for image, canvas in zip(images, [self.in_im_canvas, self.out_im_canvas]):
-            
-            # clear the current canvas and plot the new image
-            canvas.set_plot_type("image")
-            canvas._axes.imshow(image[:, :, [2, 1, 0, 3]], interpolation="none")    # convert BGRA to RGBA and display it
-            canvas.configure_imgae_plot()
-            canvas.draw()
+            canvas.set_image(image)
  
 
     def display_histogram(self):
         """
         Plot the histogram of the given image on the canvas.
-        """ 
-        for image, canvas in zip(self.get_color_channels(), [self.in_im_canvas, self.out_im_canvas]):
-            canvas.set_plot_type("histogram")
-            
-            # image can be in the form of 1-channel grayscale or 4-channel BGRA
-            channel_count = image.shape[2] if len(image.shape) == 3 else 1
-            # plot the histogram for each channel if the image has more than 1 channel
-            for i in range(channel_count):
-                channel = image if channel_count == 1 else image[:, :, i]       
-
-                # Calculate histogram values and bin edges
-                hist_vals, bin_edges = np.histogram(channel, bins=255, range=(0, 256))
-
-                # Use midpoints for x-axis
-                bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-                
-                # Set the color for the histogram
-                if self.color_channel == "RGBA":
-                    colors = ['blue', 'green', 'red', 'black']
-                elif self.color_channel == "Red" or self.color_channel == "Green" or self.color_channel == "Blue":
-                    colors = [self.color_channel]
-                else:
-                    colors = ['black']
-
-                # Plot the histogram
-                canvas._axes.step(bin_centers, hist_vals, color=colors[i], where='mid', linewidth=1)
-                canvas._axes.set_title(f"{self.color_channel} Channel")
-                canvas.configure_hist_plot()
-
-            canvas.draw()
+        """
+        # Create the shared histogram canvas (and import matplotlib) on first use
+        self.ensure_hist_canvas()
+
+        # Set the colors for the histogram channels
+        if self.color_channel == "RGBA":
+            colors = ['blue', 'green', 'red', 'black']
+        elif self.color_channel == "Red" or self.color_channel == "Green" or self.color_channel == "Blue":
+            colors = [self.color_channel]
+        else:
+            colors = ['black']
+
+        canvas = self.hist_canvas
+        canvas.clear_plot()
+
+        # Plot the input and output histograms on the two axes of the shared
+        # figure, so both sides render in a single pass
+        bins = np.arange(256)
+        sources = [self.input_BGRA, self.output_BGRA]
+        for index, (image, axes) in enumerate(zip(self.get_color_channels(), canvas._axes)):
+            # image can be in the form of 1-channel grayscale or 4-channel BGRA;
+            # the canvas computes (or reuses) one histogram per channel, keyed
+            # by the source array and channel name since the extracted views
+            # themselves are rebuilt on every render
+            for i, hist_vals in enumerate(canvas.compute_histograms(image, index, sources[index], self.color_channel)):
+                axes.step(bins, hist_vals, color=colors[i], where='mid', linewidth=1)
+
+            axes.set_title(f"{self.color_channel} Channel")
+
+        canvas.configure_hist_plot()
+        canvas.draw()
 
 
     def get_color_channels(self):
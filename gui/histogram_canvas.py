@@ -0,0 +1,287 @@
+import cv2
+import numpy as np
+
+from PySide6.QtCore import Qt, QTimer
+
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.ticker import AutoLocator
+
+
+class HistogramCanvas(FigureCanvas):
+    """
+    A matplotlib canvas displaying the input and output histograms side by side
+    on one shared figure, so both plots rasterize in a single Agg pass instead
+    of one pass per canvas. Each plot supports panning and zooming using mouse
+    events and the scroll wheel; events are routed to the axes under the cursor.
+    """
+    def __init__(self, parent=None):
+        self.figure = Figure(facecolor=(1,1,1,0))
+
+        super().__init__(self.figure)
+        self.setParent(parent)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setFocus()
+
+        self._axes = self.figure.subplots(1, 2)     # left: input, right: output
+
+        # Initialize panning variables
+        self._is_panning = False
+        self._pan_start = None
+        self._pan_index = None          # index of the axes being panned
+        self._pending_move = None       # newest mouse position awaiting a pan update
+        self._drain_scheduled = False   # whether a drain of the queued moves is pending
+
+        # Per-axes x and y limits for zooming and panning
+        self._xlim = [None, None]
+        self._ylim = [None, None]
+
+        self.lock_x_zoom = False            # Flag to lock x-axis zooming
+        self.lock_y_zoom = False            # Flag to lock y-axis zooming
+        self.is_zoomed = [False, False]     # Per-axes flags indicating a zoomed state
+
+        # Per-axes cached histograms, keyed by the source array they were
+        # computed from and the channel that was extracted. The source is held
+        # by reference and compared with `is`, since channel views are rebuilt
+        # on every render and their id()s can be recycled between renders
+        self._hist_caches = [None, None]
+        self._hist_sources = [None, None]
+        self._hist_channels = [None, None]
+
+        # Set the canvas to be transparent
+        self.setStyleSheet("background: transparent;")
+
+
+    def display_coords(self, pos):
+        """
+        Convert a Qt widget position to matplotlib display coordinates.
+        Args:
+            pos (QPointF): The position in widget (logical pixel) coordinates.
+        Returns:
+            tuple: The (x, y) position in figure display coordinates.
+        """
+        ratio = self.device_pixel_ratio
+        return pos.x() * ratio, self.figure.bbox.height - pos.y() * ratio
+
+
+    def axes_at(self, x, y):
+        """
+        Find the axes containing the given display position.
+        Args:
+            x (float): The x position in figure display coordinates.
+            y (float): The y position in figure display coordinates.
+        Returns:
+            tuple: The (index, axes) pair, or (None, None) if no axes contains it.
+        """
+        for i, axes in enumerate(self._axes):
+            if axes.bbox.contains(x, y):
+                return i, axes
+        return None, None
+
+
+    def wheelEvent(self, event):
+        """
+        Handle the mouse wheel event for zooming in and out of the plot under the cursor.
+        Args:
+            event (QWheelEvent): The wheel event containing information about the scroll direction.
+        """
+        x, y = self.display_coords(event.position())
+        index, axes = self.axes_at(x, y)
+        if axes is None:
+            return
+
+        xdata, ydata = axes.transData.inverted().transform((x, y))
+
+        xlim = axes.get_xlim()
+        ylim = axes.get_ylim()
+
+        step = event.angleDelta().y()
+        factor = 1.05 if step < 0 else 0.95
+
+        # calculate new limits
+        new_xlim = [
+            xdata - (xdata - xlim[0]) * factor,
+            xdata + (xlim[1] - xdata) * factor
+        ]
+        new_ylim = [
+            ydata - (ydata - ylim[0]) * factor,
+            ydata + (ylim[1] - ydata) * factor
+        ]
+
+        # Lock the zooming if the flags are set
+        self._xlim[index] = xlim if self.lock_x_zoom else new_xlim
+        self._ylim[index] = ylim if self.lock_y_zoom else new_ylim
+
+        # Update the axes limits and redraw the canvas
+        axes.set_xlim(self._xlim[index])
+        axes.set_ylim(self._ylim[index])
+
+        self.is_zoomed[index] = True
+
+        # Reconfigure the figure; draw_idle() coalesces redraws into one per GUI
+        # frame, since wheel events can arrive faster than the canvas can render
+        self.configure_hist_plot()
+        self.draw_idle()
+
+
+    def mousePressEvent(self, event):
+        """
+        Handle the mouse press event to initiate panning.
+        Args:
+            event (QMouseEvent): The mouse event containing information about the button pressed.
+        """
+        # Check if the left mouse button is pressed to start panning
+        if event.button() == Qt.LeftButton:
+            self._is_panning = True
+            self._pan_start = event.position()
+            self._pan_index = self.axes_at(*self.display_coords(event.position()))[0]
+
+
+    def mouseMoveEvent(self, event):
+        """
+        Handle the mouse move event to update the plot during panning.
+        Args:
+            event (QMouseEvent): The mouse event containing information about the current position.
+        """
+        # Check if panning is active and the pan start position is set
+        if self._is_panning and self._pan_start:
+            # Only record the newest position here; the limit update runs once
+            # the event queue drains, so a burst of queued move events that
+            # arrived faster than the canvas can render collapses into one update
+            self._pending_move = event.position()
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                QTimer.singleShot(0, self.drain_pan)
+
+
+    def drain_pan(self):
+        """Apply the most recent pending pan movement and redraw once."""
+        self._drain_scheduled = False
+        pos = self._pending_move
+        self._pending_move = None
+
+        # The pan may have ended while the drain was queued
+        if pos is not None and self._is_panning and self._pan_start and self._pan_index is not None:
+            index = self._pan_index
+            axes = self._axes[index]
+
+            # Calculate the distance moved in pixels
+            ratio = self.device_pixel_ratio
+            dx = (pos.x() - self._pan_start.x()) * ratio
+            dy = (pos.y() - self._pan_start.y()) * ratio
+
+            # Fetch the current limits once; the accessors are called per event
+            xlim = axes.get_xlim()
+            ylim = axes.get_ylim()
+
+            # Convert the pixel movement to data coordinates
+            dx_data = dx / axes.bbox.width * (xlim[1] - xlim[0])
+            dy_data = dy / axes.bbox.height * (ylim[1] - ylim[0])
+
+            # Update the x and y limits based on the pan distance
+            self._xlim[index] = [
+                xlim[0] - dx_data,
+                xlim[1] - dx_data
+            ]
+            self._ylim[index] = [
+                ylim[0] + dy_data,
+                ylim[1] + dy_data
+            ]
+
+            axes.set_xlim(self._xlim[index])
+            axes.set_ylim(self._ylim[index])
+
+            self._pan_start = pos
+            self.is_zoomed[index] = True
+
+            # draw_idle() coalesces redraws so panning stays responsive even
+            # when mouse-move events outpace the renderer
+            self.draw_idle()
+
+
+    def mouseReleaseEvent(self, event):
+        """
+        Handle the mouse release event to stop panning.
+        Args:
+            event (QMouseEvent): The mouse event containing information about the button released.
+        """
+        # Check if the left mouse button is released to stop panning
+        if event.button() == Qt.LeftButton:
+            self._is_panning = False
+            self._pan_start = None
+            self._pan_index = None
+
+
+    def configure_hist_plot(self):
+        """Configure both axes for histogram plots."""
+        for i, axes in enumerate(self._axes):
+            if not self.is_zoomed[i]:
+                axes.set_xlim(-1, 256)
+                axes.set_aspect('auto')
+                axes.xaxis.set_major_locator(AutoLocator())
+                axes.yaxis.set_major_locator(AutoLocator())
+
+            axes.axis('on')
+            axes.grid(True)
+            # set the x and y limits to the previous values if any to keep the zoom level
+            if self._xlim[i] is not None and self._ylim[i] is not None:
+                axes.set_xlim(self._xlim[i])
+                axes.set_ylim(self._ylim[i])
+
+        if not any(self.is_zoomed):
+            self.figure.set_facecolor((1,1,1,1))
+            self.figure.tight_layout(pad=1.5)
+
+
+    def compute_histograms(self, image, index, source, channel):
+        """
+        Compute 256-bin histograms for every channel of the image using
+        cv2.calcHist, caching the result per axes so repeated renders of the
+        same source and channel (e.g. zoom resets) skip the full pass over the
+        pixels.
+        Args:
+            image (np.ndarray): 1-channel grayscale or multi-channel uint8 image.
+            index (int): Which axes the image belongs to (0: input, 1: output).
+            source (np.ndarray): The long-lived array the image was extracted from.
+            channel (str): The name of the extracted color channel.
+        Returns:
+            list: One histogram array per channel.
+        """
+        if source is not self._hist_sources[index] or channel != self._hist_channels[index]:
+            channel_count = image.shape[2] if len(image.shape) == 3 else 1
+            image = np.ascontiguousarray(image)     # calcHist requires contiguous data
+            self._hist_caches[index] = [
+                cv2.calcHist([image], [i], None, [256], [0, 256]).ravel()
+                for i in range(channel_count)
+            ]
+            self._hist_sources[index] = source
+            self._hist_channels[index] = channel
+
+        return self._hist_caches[index]
+
+
+    def clear_plot(self):
+        """Clear the plotted data while keeping the current zoom state."""
+        for axes in self._axes:
+            axes.clear()
+
+
+    def reset_plot(self):
+        """Reset the plots by clearing the axes and resetting zoom and panning variables."""
+        for axes in self._axes:
+            axes.clear()
+        self.is_zoomed = [False, False]
+        self._xlim = [None, None]
+        self._ylim = [None, None]
+
+        # Drop the cached histograms along with their keys; a reset always
+        # precedes a re-render, so nothing stale can survive it
+        self._hist_caches = [None, None]
+        self._hist_sources = [None, None]
+        self._hist_channels = [None, None]
+
+
+    def reset_zoom(self, plot_func):
+        """Reset the zoom and panning state of the canvas."""
+        self.reset_plot()
+        plot_func()
@@ -1,14 +1,15 @@
+import os
+import bisect
+from functools import partial
+
 import cv2
-import base64
+import binascii
 import numpy as np
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QCheckBox
-
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.ticker import AutoLocator
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QImage, QPixmap, QPainter
+from PySide6.QtWidgets import (QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QCheckBox,
+                               QGraphicsView, QGraphicsScene, QFrame)
 
 from app import toolbox_bases
 import constants
@@ -17,6 +18,46 @@ from gui.gui_management import GUiManagement
 from gui.gui_components import NoArrowComboBox
 
 
+def _load_placeholder():
+    """
+    Load the pre-decoded placeholder image shipped as a raw .npy asset, which
+    skips the base64 and PNG decode stages at startup. Falls back to decoding
+    the embedded base64 constant if the asset is missing (e.g. a bundle that
+    did not package the data file).
+    """
+    asset_path = os.path.join(os.path.dirname(__file__), "placeholder.npy")
+    try:
+        return np.load(asset_path)
+    except OSError:
+        # binascii.a2b_base64 skips base64.b64decode's extra validation layer,
+        # which is safe here since the embedded constant is trusted. The
+        # placeholder is a known fully-opaque asset, so IMREAD_COLOR skips the
+        # alpha-aware decode path; the display format is BGRA, so the alpha
+        # channel is added back as a constant afterwards.
+        image = cv2.imdecode(
+            np.frombuffer(binascii.a2b_base64(constants.NO_IMAGE_BASE64), dtype=np.uint8),
+            cv2.IMREAD_COLOR
+        )
+        return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+
+
+# Load the placeholder image once at import time; it never changes, so every
+# window construction can reuse the same array
+_PLACEHOLDER_IM = _load_placeholder()
+
+# Shared stylesheet for the mid-layout buttons, built once so the f-string
+# formatting (and Qt's stylesheet cache lookup) works on a single string
+_BUTTON_STYLE = f"""
+    QPushButton {{
+        padding-top: 10px;
+        padding-bottom: 10px;
+    }}
+    QPushButton:hover {{
+        background-color: {colors.COMBO_HOVER};
+    }}
+"""
+
+
 class MainWindow(QWidget, GUiManagement):
     """
     Main window class for the image processing application.
@@ -31,27 +72,59 @@ class MainWindow(QWidget, GUiManagement):
         self.main_layout.setContentsMargins(20, 5, 20, 5) 
         self.main_layout.setSpacing(15)
 
-        # init top, mid and bottom layouts
-        self.init_top_layout()
-        self.init_midLayout()
-        self.init_bottomLayout()
+        # Shared font for the UI controls, created once instead of per layout method
+        self.ui_font = QFont()
+        self.ui_font.setPointSize(10)
+
+        # init top, mid and bottom layouts; updates are disabled meanwhile so
+        # Qt defers painting until the whole widget tree is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self.init_top_layout()
+            self.init_midLayout()
+            self.init_bottomLayout()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Cached right x-edges of the toolbox widgets, used to locate drop positions
+        self._toolbox_x_edges = None
+
+        # Timer to debounce resize events so the pipeline only reruns once the resizing settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.resize_settled)
+
+        # Window size at the time of the last pipeline rerun, used to ignore
+        # negligible resize events (e.g. 1 px jitter from the window manager)
+        self._last_pipeline_size = self.size()
 
         # Initialize UI variables in UiManagement
-        self.init_ui_variables(self.contentLayout, self.add_new_box, self.in_im_canvas, self.out_im_canvas, 
-                               self.left_title, self.right_title, self.vis_mod_list, self.color_chan_list, self.zoom_btns)  
+        self.init_ui_variables(self.contentLayout, self.add_new_box, self.in_im_canvas, self.out_im_canvas,
+                               self.left_title, self.right_title, self.vis_mod_list, self.color_chan_list, self.zoom_btns)
 
 
-        # Decode and display the base64 encoded placeholder image 
-        image_bytes = base64.b64decode(constants.NO_IMAGE_BASE64)
-        image_array = np.frombuffer(image_bytes, dtype=np.uint8)
-        initial_im = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
-        self.display_images([initial_im, initial_im])
+        # Display the pre-decoded placeholder image
+        self.display_images([_PLACEHOLDER_IM, _PLACEHOLDER_IM])
 
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
-        # Recall the pipeline to update the output image when the window is resized
+        # Ignore sub-threshold size changes; rerunning the pipeline for them
+        # costs a full recompute without any visible difference
+        new_size = event.size()
+        if (abs(new_size.width() - self._last_pipeline_size.width()) < 8 and
+                abs(new_size.height() - self._last_pipeline_size.height()) < 8):
+            return
+
+        # Restart the debounce timer so the pipeline is only rerun once the resizing settles,
+        # instead of on every intermediate resize notification
+        self._resize_timer.start(100)
+
+
+    def resize_settled(self):
+        """Rerun the pipeline once the window has settled at its new size."""
+        self._last_pipeline_size = self.size()
         self.pipeline_on_change()
         
 
@@ -61,7 +134,8 @@ class MainWindow(QWidget, GUiManagement):
         """
         # Create top layout and add it to the main layout
         top_layout = QHBoxLayout()
-        self.main_layout.addLayout(top_layout, 55)  
+        self.main_layout.addLayout(top_layout, 55)
+        self._top_layout = top_layout
 
         # create leftLayout to hold the left image and title
         left_layout = QVBoxLayout()
@@ -75,9 +149,11 @@ class MainWindow(QWidget, GUiManagement):
         left_layout.addWidget(self.left_title, alignment=Qt.AlignCenter)
         self.left_title.hide()
 
-        # Create input image canvas
-        self.in_im_canvas = InteractiveCanvas()  
+        # Create input image canvas; the shared histogram canvas is created
+        # lazily on first use so matplotlib stays off the startup path
+        self.in_im_canvas = ImageCanvas()
         left_layout.addWidget(self.in_im_canvas)
+        self.hist_canvas = None
 
         # create spacer layout to separate the two labels
         spacer = QVBoxLayout()
@@ -139,15 +215,15 @@ class MainWindow(QWidget, GUiManagement):
         self.right_title.hide()
 
         # Create output image canvas
-        self.out_im_canvas = InteractiveCanvas()
+        self.out_im_canvas = ImageCanvas()
         right_layout.addWidget(self.out_im_canvas)
 
-        # connect zoom lock buttons to their respective methods
-        x_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.in_im_canvas, "lock_x_zoom", checked))
-        x_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.out_im_canvas, "lock_x_zoom", checked))
-        y_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.in_im_canvas, "lock_y_zoom", checked))
-        y_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.out_im_canvas, "lock_y_zoom", checked))
-        reset_zoom_btn.clicked.connect(lambda: [canvas.reset_zoom(self.display_histogram) for canvas in (self.in_im_canvas, self.out_im_canvas)]) 
+        # connect zoom lock buttons to their respective methods (histogram view only);
+        # a single slot updates both canvases in one dispatch
+        x_zoom_lock_btn.toggled.connect(partial(self.set_zoom_lock, "x"))
+        y_zoom_lock_btn.toggled.connect(partial(self.set_zoom_lock, "y"))
+        reset_zoom_btn.clicked.connect(
+            lambda: self.hist_canvas.reset_zoom(self.display_histogram) if self.hist_canvas is not None else None)
 
 
     def init_midLayout(self):
@@ -158,53 +234,32 @@ class MainWindow(QWidget, GUiManagement):
         midLayout = QHBoxLayout()
         self.main_layout.addLayout(midLayout, 10) 
 
-        # Create mid layout widgets and add them to the mid layout
-        font = QFont()              
-        font.setPointSize(10)  
-        
         # Button 1 - open image
         btn = QPushButton(constants.OPEN_BUTTON)
-        midLayout.addWidget(btn, 1)      
-        btn.clicked.connect(self.open_new_image)   
+        midLayout.addWidget(btn, 1)
+        btn.clicked.connect(self.open_new_image)
         btn.setFlat(True)
-        btn.setFont(font) 
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                padding-top: 10px;
-                padding-bottom: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors.COMBO_HOVER};
-            }}
-        """)
+        btn.setFont(self.ui_font)
+        btn.setStyleSheet(_BUTTON_STYLE)
 
         # List 1 - Visualization type
         self.vis_mod_list = NoArrowComboBox(items=constants.VISUALIZATION_TYPES)
         midLayout.addWidget(self.vis_mod_list, 1)
-        self.vis_mod_list.setFont(font)
+        self.vis_mod_list.setFont(self.ui_font)
         self.vis_mod_list.currentTextChanged.connect(lambda: self.switch_view(self.vis_mod_list.currentText()))  
 
         # List 2 - Color Channel
         self.color_chan_list = NoArrowComboBox(items=list(constants.VISUALIZATION_TYPES.values())[0])
         midLayout.addWidget(self.color_chan_list, 1)
-        self.color_chan_list.setFont(font)
+        self.color_chan_list.setFont(self.ui_font)
         self.color_chan_list.currentTextChanged.connect(lambda: self.switch_color_chan(self.color_chan_list.currentText())) 
 
         # Button 2 - save image
         btn = QPushButton(constants.SAVE_BUTTON)
-        midLayout.addWidget(btn, 1)   
-        btn.clicked.connect(lambda: self.save_image())   
-        btn.setStyleSheet("padding-top: 10px; padding-bottom: 10px;")
-        btn.setFont(font) 
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                padding-top: 10px;
-                padding-bottom: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors.COMBO_HOVER};
-            }}
-        """)
+        midLayout.addWidget(btn, 1)
+        btn.clicked.connect(lambda: self.save_image())
+        btn.setFont(self.ui_font)
+        btn.setStyleSheet(_BUTTON_STYLE)
 
 
     def init_bottomLayout(self):
@@ -249,6 +304,8 @@ class MainWindow(QWidget, GUiManagement):
         """
         # Check if the event contains mime data and accept the proposed action
         if event.mimeData():
+            # Geometry is stable for the duration of a drag, so cache it once here
+            self.rebuild_toolbox_edges()
             event.acceptProposedAction()
 
 
@@ -269,9 +326,67 @@ class MainWindow(QWidget, GUiManagement):
             self.contentLayout.insertWidget(index, source)      # Insert the widget at the new index in the layout
 
             event.acceptProposedAction()            # Accept the proposed action for the drop event
+            self._toolbox_x_edges = None            # The reorder invalidated the cached geometry
             self.pipeline_on_change()                     # Rerun the pipeline to update the output image
 
 
+    def set_zoom_lock(self, axis, checked):
+        """
+        Apply a zoom-lock toggle to the histogram canvas.
+        Args:
+            axis (str): Which axis to lock, "x" or "y".
+            checked (bool): The new state of the lock checkbox.
+        """
+        if self.hist_canvas is not None:
+            setattr(self.hist_canvas, f"lock_{axis}_zoom", checked)
+
+
+    def set_top_row_mode(self, histogram):
+        """
+        Shift the top-row stretch between the side-by-side image layouts and the
+        shared histogram canvas; hidden items keep their stretch allocation, so
+        the inactive side has to be collapsed explicitly.
+        Args:
+            histogram (bool): Whether the histogram view is active.
+        """
+        self._top_layout.setStretch(0, 0 if histogram else 48)      # left image layout
+        self._top_layout.setStretch(2, 0 if histogram else 48)      # right image layout
+        if self._top_layout.count() > 3:
+            self._top_layout.setStretch(3, 96 if histogram else 0)  # histogram canvas
+
+
+    def ensure_hist_canvas(self):
+        """
+        Create the histogram canvas on first use. Deferring this also defers
+        the import of matplotlib and its Qt backend bridge, which are only
+        needed once the user opens the histogram view. One canvas hosts both
+        histogram plots, so each update rasterizes a single shared figure.
+        """
+        if self.hist_canvas is not None:
+            return
+
+        from gui.histogram_canvas import HistogramCanvas
+
+        self.hist_canvas = HistogramCanvas()
+        self._top_layout.addWidget(self.hist_canvas, 96)
+
+        # The new canvas joins the widgets toggled by the view-mode switcher
+        self.widgets_per_mode["Histogram"].append(self.hist_canvas)
+
+
+    def rebuild_toolbox_edges(self):
+        """
+        Cache the right x-edge of every toolbox widget in layout order, so drop
+        positions can be located with a binary search instead of scanning the layout.
+        """
+        self._toolbox_x_edges = []
+        for i in range(self.contentLayout.count()):
+            widget = self.contentLayout.itemAt(i).widget()
+            # Skip the special footer widget (add_new_box)
+            if widget and widget != self.add_new_box:
+                self._toolbox_x_edges.append(widget.geometry().right())
+
+
     def find_insert_index(self, pos):
         """
         Find the index in the layout where a widget should be inserted based on the drop position.
@@ -280,226 +395,139 @@ class MainWindow(QWidget, GUiManagement):
         Returns:
             int: The index where the widget should be inserted.
         """
-        # Iterate through all widgets in the content layout
-        for i in range(self.contentLayout.count()):
-            widget = self.contentLayout.itemAt(i).widget()
-            # Check if the widget is valid and not the special footer widget (add_new_box)
-            if widget and widget != self.add_new_box:
-                # If the drop position is within the geometry of the widget, return its index
-                if widget.geometry().contains(pos):
-                    return i
-        # If no suitable position is found, return the last index (before add_new_box)
-        return self.contentLayout.count() - 1
+        # Rebuild the cached geometry if it was invalidated since the last drag
+        if self._toolbox_x_edges is None:
+            self.rebuild_toolbox_edges()
+
+        # Binary search the cached edges; a drop past every toolbox yields the
+        # last index (before add_new_box), matching len(self._toolbox_x_edges)
+        return bisect.bisect_left(self._toolbox_x_edges, pos.x())
 
 
 
-class InteractiveCanvas(FigureCanvas):
+class ImageCanvas(QGraphicsView):
     """
-    A custom canvas for displaying and interacting with matplotlib figures.
-    This canvas supports panning and zooming using mouse events and the scroll wheel.
+    A graphics view for displaying images natively through Qt.
+    Panning and zooming manipulate the view transform directly, so repaints
+    are hardware-accelerated pixmap blits instead of full figure rasterizations.
     """
     def __init__(self, parent=None):
-        self.figure = Figure(facecolor=(1,1,1,0))
+        super().__init__(parent)
+
+        # Scene with a single pixmap item holding the displayed image
+        self._scene = QGraphicsScene(self)
+        self.setScene(self._scene)
+        self._pixmap_item = self._scene.addPixmap(QPixmap())
+
+        # Scale smoothly (bilinear) while idle; interaction temporarily switches
+        # to fast nearest-neighbour scaling via the draft-mode timer below
+        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        self._draft_timer = QTimer(self)
+        self._draft_timer.setSingleShot(True)
+        self._draft_timer.timeout.connect(self.end_draft_mode)
+
+        # Pan by dragging, zoom towards the cursor position
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        super().__init__(self.figure)
-        self.setParent(parent)
-        self.setFocusPolicy(Qt.StrongFocus)
-        self.setFocus()
-
-        self._axes = self.figure.add_subplot(111)               # Create a single axes 
-
-        # Initialize panning variables 
-        self._is_panning = False
-        self._pan_start = None
+        # Set the canvas to be transparent
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("background: transparent;")
+        self._scene.setBackgroundBrush(Qt.transparent)
 
-        # Variables to store x a nd y limits for zooming and panning
-        self._xlim = None
-        self._ylim = None
+        self.is_zoomed = False      # Flag to indicate if the canvas is zoomed
+        self._im_size = None        # (width, height) of the displayed image
+        self._fit_scale = 1.0       # view scale at which the image exactly fits
 
-        # Variables to store original x and y limits for zooming and panning limits
-        self._orig_xlim = None
-        self._orig_ylim = None
 
-        self.lock_x_zoom = False    # Flag to lock x-axis zooming
-        self.lock_y_zoom = False    # Flag to lock y-axis zooming
-        self.is_zoomed = False      # Flag to indicate if the canvas is zoomed
-        self.plot_type = "image"  
+    def set_image(self, image):
+        """
+        Display a BGRA image on the canvas.
+        Args:
+            image (np.ndarray): The image to display as a 4-channel BGRA uint8 array.
+        """
+        # QImage.Format_ARGB32 stores pixels as B,G,R,A bytes on little-endian
+        # machines, so the BGRA buffer can be wrapped without any conversion
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        qimage = QImage(image.data, width, height, image.strides[0], QImage.Format_ARGB32)
+        self._pixmap_item.setPixmap(QPixmap.fromImage(qimage))
+
+        # Refit the view unless the user zoom still applies to an image of the same size
+        if self._im_size != (width, height) or not self.is_zoomed:
+            self._im_size = (width, height)
+            self._scene.setSceneRect(0, 0, width, height)
+            self.fit_in_view()
+            self.is_zoomed = False      # the refit discarded any previous zoom
+
+
+    def fit_in_view(self):
+        """Scale the view so the whole image is visible and remember the fit scale."""
+        if self._im_size is None:
+            return
 
-        # Set the canvas to be transparent
-        self.setStyleSheet("background: transparent;")  
+        # Fit to the scene rect rather than the pixmap item; the item's shape
+        # follows its opaque-pixel mask, which misfits images with transparency
+        self.resetTransform()
+        self.fitInView(self._scene.sceneRect(), Qt.KeepAspectRatio)
+        self._fit_scale = self.transform().m11()
 
 
     def wheelEvent(self, event):
         """
-        Handle the mouse wheel event for zooming in and out of the plot.
+        Handle the mouse wheel event for zooming in and out of the image.
         Args:
             event (QWheelEvent): The wheel event containing information about the scroll direction.
         """
-        if self._axes is None:
+        if self._im_size is None:
             return
-        
-        pos = event.position()
-        x, y = pos.x(), pos.y()
-        xdata, ydata = self._axes.transData.inverted().transform((x, y))
 
-        xlim = self._axes.get_xlim()
-        ylim = self._axes.get_ylim()
+        self.begin_draft_mode()
 
         step = event.angleDelta().y()
-        factor = 1.05 if step < 0 else 0.95
-
-        # calculate new limits
-        self._xlim = [
-            xdata - (xdata - xlim[0]) * factor,
-            xdata + (xlim[1] - xdata) * factor
-        ]
-        self._ylim = [
-            ydata - (ydata - ylim[0]) * factor,
-            ydata + (ylim[1] - ydata) * factor
-        ]
-
-        if self.plot_type != "histogram":
-            # ensure the new limits do not go below 0 or exceed original limits
-            self._xlim[0] = max(0, self._xlim[0])  
-            self._ylim[1] = max(0, self._ylim[1])  
-            self._xlim[1] = min(self._orig_xlim[1], self._xlim[1]) 
-            self._ylim[0] = min(self._orig_ylim[0], self._ylim[0])  
-
-        # Lock the zooming if the flags are set
-        self._xlim = xlim if self.lock_x_zoom else self._xlim
-        self._ylim = ylim if self.lock_y_zoom else self._ylim
-
-        # Update the axes limits and redraw the canvas
-        self._axes.set_xlim(self._xlim)
-        self._axes.set_ylim(self._ylim)
-
-        # Reconfigure the figure
-        if self.plot_type == "image":
-            self.configure_imgae_plot()
-        elif self.plot_type == "histogram":
-            self.configure_hist_plot()
-        
-        self.draw()
+        factor = 1 / 1.05 if step < 0 else 1.05
 
-        self.is_zoomed = True
+        # Do not allow zooming out beyond the fitted view
+        if self.transform().m11() * factor <= self._fit_scale:
+            self.fit_in_view()
+            self.is_zoomed = False
+            return
 
-    def mousePressEvent(self, event):
-        """
-        Handle the mouse press event to initiate panning.
-        Args:
-            event (QMouseEvent): The mouse event containing information about the button pressed.
-        """
-        # Check if the left mouse button is pressed to start panning
-        if event.button() == Qt.LeftButton:
-            self._is_panning = True
-            self._pan_start = event.position()
+        self.scale(factor, factor)
+        self.is_zoomed = True
 
 
     def mouseMoveEvent(self, event):
-        """
-        Handle the mouse move event to update the plot during panning.
-        Args:
-            event (QMouseEvent): The mouse event containing information about the current position.
-        """
-        # Check if panning is active and the pan start position is set
-        if self._is_panning and self._pan_start:
-
-            # Calculate the distance moved in pixels
-            dx = event.position().x() - self._pan_start.x()
-            dy = event.position().y() - self._pan_start.y()
-
-            # Convert the pixel movement to data coordinates
-            dx_data = dx / self.width() * (self._axes.get_xlim()[1] - self._axes.get_xlim()[0])
-            dy_data = dy / self.height() * (self._axes.get_ylim()[1] - self._axes.get_ylim()[0])
-
-            # Update the x and y limits based on the pan distance
-            self._xlim = [
-                self._axes.get_xlim()[0] - dx_data,
-                self._axes.get_xlim()[1] - dx_data
-            ]
-            self._ylim = [
-                self._axes.get_ylim()[0] + dy_data,
-                self._axes.get_ylim()[1] + dy_data
-            ]
-
-            if self.plot_type == "histogram":
-                self._axes.set_xlim(self._xlim)
-                self._axes.set_ylim(self._ylim)
-            else:
-                # ensure the new limits do not go below 0 or exceed original limits
-                if not (self._xlim[0] < 0 or self._xlim[1] > self._orig_xlim[1]):
-                    self._axes.set_xlim(self._xlim)
-                if not (self._ylim[1] < 0 or self._ylim[0] > self._orig_ylim[0]):
-                    self._axes.set_ylim(self._ylim)
-
-            self._pan_start = event.position()
-            self.draw()
-
-            self.is_zoomed = True
-
-
-    def mouseReleaseEvent(self, event):
-        """
-        Handle the mouse release event to stop panning.
-        Args:
-            event (QMouseEvent): The mouse event containing information about the button released.
-        """
-        # Check if the left mouse button is released to stop panning
-        if event.button() == Qt.LeftButton:
-            self._is_panning = False
-            self._pan_start = None
+        # Dragging repaints the scaled pixmap continuously, so pan in draft mode too
+        if event.buttons() & Qt.LeftButton:
+            self.begin_draft_mode()
+        super().mouseMoveEvent(event)
 
 
-    def configure_imgae_plot(self):
-        """Configure the axes for image plots."""
-        if not self.is_zoomed:
-            # get original x and y limits to limit zooming and panning
-            self._orig_xlim = self._axes.get_xlim()
-            self._orig_ylim = self._axes.get_ylim()
-
-        # set the x and y limits to the previous values if any to keep the zoom level
-        if self._xlim and self._ylim:
-            self._axes.set_xlim(self._xlim)
-            self._axes.set_ylim(self._ylim)
-        
-        self._axes.axis('off')  
-        self._axes.grid(False)
-        self.figure.set_facecolor((1,1,1,0))  
-        self.figure.subplots_adjust(left=0, right=1, top=1, bottom=0) 
+    def begin_draft_mode(self):
+        """Switch to fast nearest-neighbour scaling while interaction is active."""
+        self.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        self._draft_timer.start(150)
 
 
-    def configure_hist_plot(self):
-        """Configure the axes for histogram plots."""
-        if not self.is_zoomed:
-            self.figure.set_facecolor((1,1,1,1)) 
-            self._axes.set_xlim(-1, 256)
-            self._axes.set_aspect('auto')  
-            self._axes.xaxis.set_major_locator(AutoLocator())
-            self._axes.yaxis.set_major_locator(AutoLocator())
-            self.figure.tight_layout(pad=1.5)
-
-        self._axes.axis('on')  
-        self._axes.grid(True)
-        # set the x and y limits to the previous values if any to keep the zoom level
-        if self._xlim and self._ylim:
-            self._axes.set_xlim(self._xlim)
-            self._axes.set_ylim(self._ylim)
-
-
-    def reset_plot(self):
-        """Reset the plot by clearing the axes and resetting zoom and panning variables."""
-        self._axes.clear()                             
-        self.is_zoomed = False
-        self._xlim = 0
-        self._ylim = 0    
+    def end_draft_mode(self):
+        """Restore smooth scaling and repaint once interaction has settled."""
+        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        self.viewport().update()
 
 
-    def set_plot_type(self, plot_type):
-        """Set the type of plot to be displayed on the canvas."""
-        self._axes.clear()  
-        self.plot_type = plot_type
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
 
-    def reset_zoom(self, plot_func):
+        # Keep the image fitted to the new viewport size while not zoomed in
+        if not self.is_zoomed:
+            self.fit_in_view()
+
+
+    def reset_zoom(self):
         """Reset the zoom and panning state of the canvas."""
-        self.reset_plot()
-        plot_func()
+        self.is_zoomed = False
+        self.fit_in_view()